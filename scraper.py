@@ -6,16 +6,21 @@ Uses Playwright to scrape aggregator sites and extract all external links,
 then follows redirect URLs to discover casino domains.
 """
 
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
 import re
 import random
 import time
 from urllib.parse import urlparse, parse_qs, unquote
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import zip_longest
 from pathlib import Path
 import json
 import logging
 
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeout
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -35,8 +40,13 @@ AGGREGATOR_URLS = [
     'https://www.nongamstopcasino.us.com/'
 ]
 
+# Hosts of the aggregators above, derived once so the two lists can't drift
+AGGREGATOR_DOMAINS = frozenset(
+    urlparse(url).netloc.lower().removeprefix('www.') for url in AGGREGATOR_URLS
+)
+
 # Domains to exclude
-EXCLUDE_DOMAINS = {
+EXCLUDE_DOMAINS = frozenset({
     # Common sites
     'google.com', 'facebook.com', 'twitter.com', 'youtube.com', 'instagram.com',
     'linkedin.com', 'reddit.com', 'wikipedia.org', 'amazon.com', 't.co', 'x.com',
@@ -49,54 +59,132 @@ EXCLUDE_DOMAINS = {
     'w3.org', 'schema.org', 'trustpilot.com', 'cloudflare-dns.com',
     'jquery.com', 'bootstrapcdn.com', 'fontawesome.com', 'fonts.google.com',
     'googletagmanager.com', 'google-analytics.com', 'doubleclick.net',
-    # Aggregators (we scrape them, don't block)
-    'pieria.co.uk', 'vso.org.uk', 'egamersworld.com', 'esportsinsider.com',
-    'thebigfixup.us.org', 'wizardexploratorium.uk.com', 'peopletree.eu',
-    'yorkshire-bridge.gr.com', 'inlandhome.us.org', 'onlinecasinosnotongamstop.uk.net',
+    # Other aggregators (not scraped, but don't block them either)
     'nongamstopcasinos.net', 'casinonotongamstop.com', 'casinosnotongamstop.org',
     'briangriff.com',
-}
+}) | AGGREGATOR_DOMAINS  # Aggregators we scrape, don't block
 
 # Gambling TLDs and keywords
-GAMBLING_TLDS = {'.casino', '.bet', '.games', '.game', '.io', '.ag', '.gg', '.vip', '.win', '.fun'}
-GAMBLING_KEYWORDS = ['casino', 'bet', 'slots', 'poker', 'spin', 'vegas', 'lucky', 'jackpot', 
-                     'win', 'game', 'play', 'wager', 'stake', 'roulette', 'bingo', 'slot']
+GAMBLING_TLDS = frozenset({'.casino', '.bet', '.games', '.game', '.io', '.ag', '.gg', '.vip', '.win', '.fun'})
+GAMBLING_KEYWORDS = ('casino', 'bet', 'slots', 'poker', 'spin', 'vegas', 'lucky', 'jackpot',
+                     'win', 'game', 'play', 'wager', 'stake', 'roulette', 'bingo', 'slot')
 
+# Path fragments that mark an aggregator link as a redirect/affiliate link
+REDIRECT_PATH_PATTERNS = ('/go/', '/out/', '/visit/', '/redirect/', '/link/', '/click/',
+                          '/track/', '/aff/', '/partner/', '/ref/', '/c/', '/r/')
 
-class NonGamstopScraper:
-    def __init__(self):
-        self.domains = set()
-    
-    def is_valid_domain(self, domain: str) -> bool:
-        domain = domain.lower().strip()
-        if not domain or len(domain) < 4 or len(domain) > 100:
-            return False
-        if '.' not in domain:
-            return False
-        if not re.match(r'^[a-z0-9][-a-z0-9.]*[a-z0-9]$', domain):
-            return False
-        for excluded in EXCLUDE_DOMAINS:
-            if domain == excluded or domain.endswith('.' + excluded):
-                return False
-        return True
-    
-    def looks_like_casino(self, domain: str) -> bool:
-        domain_lower = domain.lower()
-        for tld in GAMBLING_TLDS:
-            if domain_lower.endswith(tld):
-                return True
-        for keyword in GAMBLING_KEYWORDS:
-            if keyword in domain_lower:
-                return True
+# Query parameters that commonly carry the destination of a redirect link
+REDIRECT_PARAMS = ('url', 'redirect', 'destination', 'target', 'goto', 'link', 'out', 'u', 'r', 'd')
+
+# Desktop Chrome user agent shared by browser contexts and HTTP redirect requests
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Resource types we never need since only <a href> and final URLs are read
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+# Analytics/ad hosts whose requests are aborted regardless of resource type
+BLOCKED_TRACKER_DOMAINS = frozenset({
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'googlesyndication.com', 'facebook.net', 'hotjar.com',
+})
+
+# Number of aggregators scraped concurrently; each worker reuses one browser context
+MAX_CONCURRENT_AGGREGATORS = 4
+
+# Number of redirect URLs followed concurrently across all aggregators
+MAX_CONCURRENT_REDIRECTS = 6
+
+# Number of concurrent redirect requests to any single host
+MAX_REQUESTS_PER_HOST = 2
+
+# Maximum number of uncached redirect URLs followed per run
+MAX_REDIRECTS = 200
+
+# Resolved redirect URLs are cached between runs for this long (several
+# weekly scheduled runs, so cron start jitter can't expire entries early)
+REDIRECT_CACHE_FILE = Path(__file__).parent / '.cache' / 'redirects.json'
+REDIRECT_CACHE_TTL = 30 * 24 * 60 * 60
+
+# Extra attempts for aggregator page loads that fail transiently, with a
+# shorter timeout (ms) so a dead site doesn't hold a pool context for long
+NAVIGATION_RETRIES = 2
+RETRY_NAVIGATION_TIMEOUT = 20000
+
+# Network errors worth retrying; anything else (DNS, TLS) is permanent
+TRANSIENT_NAVIGATION_ERRORS = (
+    'net::ERR_CONNECTION_RESET',
+    'net::ERR_CONNECTION_REFUSED',
+    'net::ERR_CONNECTION_CLOSED',
+    'net::ERR_CONNECTION_TIMED_OUT',
+    'net::ERR_EMPTY_RESPONSE',
+    'net::ERR_NETWORK_CHANGED',
+    'net::ERR_TIMED_OUT',
+)
+
+# Lookup structures derived once from the constants above
+_DOMAIN_RE = re.compile(r'^[a-z0-9][-a-z0-9.]*[a-z0-9]\Z')
+_GAMBLING_TLD_SUFFIXES = tuple(GAMBLING_TLDS)
+_CASINO_RE = re.compile('|'.join(map(re.escape, GAMBLING_KEYWORDS)))
+_REDIRECT_PATH_RE = re.compile('|'.join(map(re.escape, REDIRECT_PATH_PATTERNS)), re.IGNORECASE)
+_TRACKER_SUFFIXES = tuple('.' + d for d in BLOCKED_TRACKER_DOMAINS)
+_DIGITS = frozenset('0123456789')
+
+
+def normalize_domain(domain: str) -> str:
+    """Lowercase and strip a domain, dropping a leading www. label."""
+    domain = domain.strip().lower()
+    return domain[4:] if domain.startswith('www.') else domain
+
+
+@lru_cache(maxsize=65536)
+def is_valid_domain(domain: str) -> bool:
+    # Expects a stripped, lowercase domain (see normalize_domain)
+    if not 4 <= len(domain) <= 100 or '.' not in domain or not _DOMAIN_RE.match(domain):
         return False
-    
-    def extract_domain_from_url(self, url: str) -> str:
+    # Check the domain and each parent suffix (down to two labels) against
+    # the exclusion set
+    suffix = domain
+    while '.' in suffix:
+        if suffix in EXCLUDE_DOMAINS:
+            return False
+        suffix = suffix.partition('.')[2]
+    return True
+
+
+@lru_cache(maxsize=65536)
+def looks_like_casino(domain: str) -> bool:
+    domain_lower = domain.lower()
+    return domain_lower.endswith(_GAMBLING_TLD_SUFFIXES) or bool(_CASINO_RE.search(domain_lower))
+
+
+@lru_cache(maxsize=8192)
+def extract_domain_from_url(url: str) -> str:
+    start = url.find('://')
+    if start <= 0 or not url[:start].isalpha():
+        # No plain scheme in front (e.g. scheme-relative, or a bare
+        # 'casino.com/?ref=https://...' query value), let urlparse handle it
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower().replace('www.', '')
-            return domain
+            host = urlparse(url).netloc
         except Exception:
             return ''
+    else:
+        start += 3
+        end = len(url)
+        for sep in '/?#':
+            i = url.find(sep, start, end)
+            if i != -1:
+                end = i
+        host = url[start:end]
+    # Drop any userinfo and port
+    return normalize_domain(host.rpartition('@')[2].partition(':')[0])
+
+
+class NonGamstopScraper:
+    def __init__(self):
+        self.domains = set()
+        self.redirect_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REDIRECTS)
+        self.redirect_cache = {}
+        self.host_semaphores = defaultdict(lambda: asyncio.Semaphore(MAX_REQUESTS_PER_HOST))
     
     def extract_destination_from_redirect(self, url: str) -> str:
         """Try to extract destination domain from redirect URL parameters."""
@@ -104,17 +192,16 @@ class NonGamstopScraper:
             parsed = urlparse(url)
             # Check common redirect parameter names
             params = parse_qs(parsed.query)
-            for param in ['url', 'redirect', 'destination', 'target', 'goto', 'link', 'out', 'u', 'r', 'd']:
+            for param in REDIRECT_PARAMS:
                 if param in params:
                     dest_url = unquote(params[param][0])
-                    return self.extract_domain_from_url(dest_url)
+                    return extract_domain_from_url(dest_url)
             
             # Check if domain is embedded in path (like /go/casino-name/)
-            path = parsed.path.lower()
             # Extract potential domain from path segments
-            segments = [s for s in path.split('/') if s and '.' in s]
+            segments = [normalize_domain(s) for s in parsed.path.split('/') if '.' in s]
             for seg in segments:
-                if self.is_valid_domain(seg) and self.looks_like_casino(seg):
+                if is_valid_domain(seg) and looks_like_casino(seg):
                     return seg
                     
         except Exception:
@@ -123,167 +210,322 @@ class NonGamstopScraper:
     
     def is_redirect_url(self, url: str, base_domain: str) -> bool:
         """Check if URL looks like a redirect/affiliate link."""
-        url_lower = url.lower()
-        # Common redirect patterns
-        patterns = ['/go/', '/out/', '/visit/', '/redirect/', '/link/', '/click/', 
-                   '/track/', '/aff/', '/partner/', '/ref/', '/c/', '/r/']
-        
-        domain = self.extract_domain_from_url(url)
+        domain = extract_domain_from_url(url)
         # It's on the same aggregator domain but has a redirect path
         if domain == base_domain or domain.endswith('.' + base_domain):
-            return any(p in url_lower for p in patterns)
+            return _REDIRECT_PATH_RE.search(url) is not None
         return False
     
-    def follow_redirect(self, browser, url: str) -> str:
+    async def block_heavy_resources(self, route):
+        """Abort requests for assets and trackers that don't affect link extraction."""
+        request = route.request
+        # Asset URLs are nearly all unique, so don't run them through the
+        # extract_domain_from_url cache meant for links and redirects
+        host = urlparse(request.url).hostname or ''
+        if (request.resource_type in BLOCKED_RESOURCE_TYPES
+                or host in BLOCKED_TRACKER_DOMAINS or host.endswith(_TRACKER_SUFFIXES)):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def goto_with_retry(self, page, url: str):
+        """Navigate to an aggregator page, retrying transient failures with backoff."""
+        for attempt in range(NAVIGATION_RETRIES + 1):
+            try:
+                if attempt:
+                    return await page.goto(url, wait_until='domcontentloaded',
+                                           timeout=RETRY_NAVIGATION_TIMEOUT)
+                return await page.goto(url, wait_until='domcontentloaded')
+            except PlaywrightError as e:
+                transient = isinstance(e, PlaywrightTimeout) or any(
+                    code in str(e) for code in TRANSIENT_NAVIGATION_ERRORS)
+                if attempt == NAVIGATION_RETRIES or not transient:
+                    raise
+                delay = 2 * 2 ** attempt
+                logger.info(f"  Retrying {url} in {delay}s: {e}")
+                await asyncio.sleep(delay)
+    
+    async def wait_for_network_idle(self, page, timeout: int = 5000):
+        """Wait until the page has no network activity, up to timeout ms."""
+        try:
+            await page.wait_for_load_state('networkidle', timeout=timeout)
+        except PlaywrightTimeout:
+            pass
+    
+    def load_redirect_cache(self):
+        """Load redirect resolutions from previous runs, dropping expired ones."""
+        if not REDIRECT_CACHE_FILE.exists():
+            return
+        cutoff = time.time() - REDIRECT_CACHE_TTL
+        try:
+            cache = json.loads(REDIRECT_CACHE_FILE.read_text())
+            # Skip malformed entries rather than failing mid-scrape on them
+            self.redirect_cache = {
+                url: entry for url, entry in cache.items()
+                if isinstance(entry, dict)
+                and isinstance(entry.get('domain'), str)
+                and isinstance(entry.get('ts'), (int, float))
+                and entry['ts'] > cutoff
+            }
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable redirect cache: {e}")
+            return
+        logger.info(f"Loaded {len(self.redirect_cache)} cached redirects")
+    
+    def save_redirect_cache(self):
+        """Persist redirect resolutions for the next run; failure only costs speed."""
+        try:
+            REDIRECT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            REDIRECT_CACHE_FILE.write_text(json.dumps(self.redirect_cache))
+        except OSError as e:
+            logger.warning(f"Could not save redirect cache: {e}")
+    
+    @asynccontextmanager
+    async def borrow_context(self, contexts: asyncio.Queue):
+        """Take a browser context from the pool, clearing its cookies on return."""
+        context = await contexts.get()
+        try:
+            yield context
+        finally:
+            # Don't carry one site's cookies into the next, but always hand the
+            # context back even if clearing fails, or waiting borrowers hang
+            try:
+                await context.clear_cookies()
+            finally:
+                contexts.put_nowait(context)
+    
+    async def follow_redirect(self, request_context, contexts: asyncio.Queue, url: str) -> str:
         """Follow a redirect URL and return the final destination domain."""
-        context = None
+        cached = self.redirect_cache.get(url)
+        if cached:
+            return cached['domain']
+        # Different aggregators proceed in parallel; each one sees only a few
+        # requests at a time
+        async with self.host_semaphores[extract_domain_from_url(url)], self.redirect_semaphore:
+            domain = await self.resolve_http_redirect(request_context, url)
+            if not domain or not looks_like_casino(domain):
+                # No server-side redirect, or it stopped at a tracker hop that
+                # continues with a JS/meta refresh, so render the page instead
+                async with self.borrow_context(contexts) as context:
+                    page_domain = await self.resolve_page_redirect(context, url)
+                # Keep the HTTP result if the page never left the aggregator
+                if page_domain and (not domain or page_domain != extract_domain_from_url(url)):
+                    domain = page_domain
+        if domain:
+            self.redirect_cache[url] = {'domain': domain, 'ts': time.time()}
+        return domain
+    
+    async def resolve_http_redirect(self, request_context, url: str) -> str:
+        """Resolve a plain HTTP redirect without rendering a page.
+        
+        Uses GET rather than HEAD: many affiliate trackers answer HEAD with
+        405 or skip the redirect entirely, as they only expect browsers.
+        """
         try:
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            )
-            page = context.new_page()
+            response = await request_context.get(url, max_redirects=10)
+            final_domain = extract_domain_from_url(response.url)
+            await response.dispose()
+        except PlaywrightError as e:
+            logger.debug(f"Error requesting redirect: {e}")
+            return ''
+        # Landing back on the same host means nothing was resolved
+        if final_domain == extract_domain_from_url(url):
+            return ''
+        return final_domain
+    
+    async def resolve_page_redirect(self, context, url: str) -> str:
+        """Resolve a redirect by loading it in a browser page."""
+        page = None
+        try:
+            page = await context.new_page()
             
             # Navigate and wait briefly
-            page.goto(url, timeout=15000, wait_until='commit')
-            time.sleep(2)
+            await page.goto(url, timeout=15000, wait_until='commit')
+            await asyncio.sleep(2)
             
             # Get final URL
-            final_domain = self.extract_domain_from_url(page.url)
+            final_domain = extract_domain_from_url(page.url)
             return final_domain
             
         except Exception as e:
             logger.debug(f"Error following redirect: {e}")
             return ''
         finally:
-            if context:
+            if page:
                 try:
-                    context.close()
+                    await page.close()
                 except Exception:
                     pass
     
-    def scrape_aggregator(self, browser, url: str) -> set:
-        """Scrape a single aggregator URL for all external links."""
-        found = set()
-        context = None
+    async def collect_links(self, context, url: str) -> tuple:
+        """Scrape a single aggregator URL for direct casino domains and a set of redirect URLs."""
+        direct_domains = set()
+        redirect_urls = set()
+        page = None
         
         try:
             logger.info(f"Scraping: {url}")
             
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                locale='en-GB',
-                timezone_id='Europe/London',
-            )
-            
-            page = context.new_page()
-            page.goto(url, timeout=60000, wait_until='domcontentloaded')
-            time.sleep(random.uniform(2, 4))
+            page = await context.new_page()
+            await self.goto_with_retry(page, url)
+            await self.wait_for_network_idle(page)
             
             final_url = page.url
-            base_domain = self.extract_domain_from_url(final_url)
+            base_domain = extract_domain_from_url(final_url)
             
             if final_url != url:
                 logger.info(f"  Redirected to: {final_url}")
             
-            # Scroll to load content
-            for scroll_pos in [0.33, 0.66, 1.0, 0]:
-                try:
-                    page.evaluate(f'window.scrollTo(0, document.body.scrollHeight * {scroll_pos})')
-                    time.sleep(0.5)
-                except Exception:
-                    pass
-            
-            # Extract ALL links from the page
-            all_links = page.evaluate('''() => {
-                const links = [];
-                document.querySelectorAll('a[href]').forEach(a => {
-                    const href = a.href || a.getAttribute('href');
-                    if (href && href.startsWith('http')) {
-                        links.push(href);
+            # Scroll until the page stops growing to trigger lazy-loaded content
+            try:
+                await page.evaluate('''async () => {
+                    const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+                    let height = 0;
+                    for (let i = 0; i < 6 && document.body.scrollHeight !== height; i++) {
+                        height = document.body.scrollHeight;
+                        window.scrollTo(0, height);
+                        await sleep(300);
                     }
-                });
-                return [...new Set(links)];  // dedupe
-            }''')
+                    window.scrollTo(0, 0);
+                }''')
+            except PlaywrightError:
+                pass
             
-            logger.info(f"  Found {len(all_links)} total links")
+            # Extract ALL links from the page, split in the browser into
+            # same-site URLs and unique external hosts
+            links = await page.eval_on_selector_all('a[href]', '''(els, base) => {
+                const internal = new Set();
+                const external = new Set();
+                for (const a of els) {
+                    if (!a.href.startsWith('http')) continue;
+                    const host = a.hostname.replace(/^www\\./, '');
+                    if (host === base || host.endsWith('.' + base)) {
+                        internal.add(a.href);
+                    } else {
+                        external.add(host);
+                    }
+                }
+                return {internal: [...internal], external: [...external]};
+            }''', base_domain)
             
-            redirect_urls = []
-            direct_domains = set()
+            for link in links['internal']:
+                # Same site, but check if it's a redirect URL
+                if self.is_redirect_url(link, base_domain):
+                    redirect_urls.add(link)
+                    # Try to extract destination from URL params
+                    dest = self.extract_destination_from_redirect(link)
+                    if dest and is_valid_domain(dest):
+                        direct_domains.add(dest)
             
-            for link in all_links:
-                link_domain = self.extract_domain_from_url(link)
-                
-                # Skip if it's the same site
-                if link_domain == base_domain or link_domain.endswith('.' + base_domain):
-                    # But check if it's a redirect URL
-                    if self.is_redirect_url(link, base_domain):
-                        redirect_urls.append(link)
-                        # Try to extract destination from URL params
-                        dest = self.extract_destination_from_redirect(link)
-                        if dest and self.is_valid_domain(dest):
-                            direct_domains.add(dest)
-                    continue
-                
-                # External domain
-                if self.is_valid_domain(link_domain) and self.looks_like_casino(link_domain):
+            for link_domain in links['external']:
+                if is_valid_domain(link_domain) and looks_like_casino(link_domain):
                     direct_domains.add(link_domain)
             
-            logger.info(f"  Found {len(direct_domains)} direct casino domains")
-            logger.info(f"  Found {len(redirect_urls)} redirect URLs to follow")
-            
-            # Add direct domains
-            for domain in direct_domains:
-                found.add(domain)
+            logger.info(f"  {url}: {len(direct_domains)} direct casino domains, "
+                        f"{len(redirect_urls)} redirect URLs")
+            for domain in sorted(direct_domains):
                 logger.info(f"    Direct: {domain}")
             
-            # Follow redirect URLs (limit to avoid taking too long)
-            max_redirects = 20
-            for redirect_url in redirect_urls[:max_redirects]:
-                domain = self.follow_redirect(browser, redirect_url)
-                if domain and self.is_valid_domain(domain) and domain != base_domain:
-                    if domain not in found:
-                        found.add(domain)
-                        logger.info(f"    Redirect -> {domain}")
-                time.sleep(random.uniform(0.5, 1.0))
-            
-            logger.info(f"  Total domains from this page: {len(found)}")
-            
         except PlaywrightTimeout:
             logger.warning(f"  Timeout loading {url}")
         except Exception as e:
             logger.warning(f"  Error scraping {url}: {e}")
         finally:
-            if context:
+            if page:
                 try:
-                    context.close()
+                    await page.close()
                 except Exception:
                     pass
         
+        return direct_domains, redirect_urls
+    
+    async def resolve_redirects(self, request_context, contexts: asyncio.Queue, redirect_urls: set) -> set:
+        """Follow redirect URLs gathered from all aggregators and return their destinations."""
+        cached = sorted(u for u in redirect_urls if u in self.redirect_cache)
+        by_host = defaultdict(list)
+        for u in sorted(u for u in redirect_urls if u not in self.redirect_cache):
+            by_host[extract_domain_from_url(u)].append(u)
+        # Limit new lookups to avoid taking too long, taking them round-robin
+        # across aggregators so every site gets a share of the budget
+        uncached = [u for batch in zip_longest(*by_host.values()) for u in batch if u is not None]
+        urls = cached + uncached[:MAX_REDIRECTS]
+        logger.info(f"Following {len(urls)} of {len(redirect_urls)} unique redirect URLs "
+                    f"({len(cached)} cached)")
+        
+        domains = await asyncio.gather(
+            *(self.follow_redirect(request_context, contexts, u) for u in urls),
+            return_exceptions=True
+        )
+        
+        found = set()
+        for url, domain in zip(urls, domains):
+            if isinstance(domain, Exception):
+                logger.debug(f"Error following redirect {url}: {domain}")
+                continue
+            # Ignore redirects that stay on the aggregator itself
+            if domain and is_valid_domain(domain) and domain != extract_domain_from_url(url):
+                if domain not in found:
+                    found.add(domain)
+                    logger.info(f"    Redirect -> {domain}")
         return found
     
-    def scrape_with_browser(self) -> set:
-        """Scrape all aggregator URLs using Playwright."""
+    async def scrape_with_browser(self) -> set:
+        """Scrape all aggregator URLs concurrently using Playwright."""
         all_found = set()
+        redirect_urls = set()
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(
                 headless=True,
-                args=['--disable-blink-features=AutomationControlled']
+                args=[
+                    '--disable-blink-features=AutomationControlled',
+                    # Nothing is rendered for display, and CI runners have a small /dev/shm
+                    '--disable-gpu',
+                    '--disable-dev-shm-usage',
+                ]
             )
+            # Plain HTTP client for resolving server-side redirects
+            request_context = await p.request.new_context(user_agent=USER_AGENT, timeout=15000)
             
-            for url in AGGREGATOR_URLS:
-                time.sleep(random.uniform(2, 4))
-                
-                try:
-                    found = self.scrape_aggregator(browser, url)
-                    all_found.update(found)
-                except Exception as e:
-                    logger.warning(f"Failed to scrape {url}: {e}")
+            # Pool of contexts; the pool size bounds aggregator concurrency
+            contexts = asyncio.Queue()
+            for _ in range(MAX_CONCURRENT_AGGREGATORS):
+                context = await browser.new_context(
+                    viewport={'width': 1920, 'height': 1080},
+                    user_agent=USER_AGENT,
+                    locale='en-GB',
+                    timezone_id='Europe/London',
+                )
+                context.set_default_navigation_timeout(60000)
+                context.set_default_timeout(10000)
+                await context.route('**/*', self.block_heavy_resources)
+                contexts.put_nowait(context)
+            
+            async def bounded_collect(index: int, url: str) -> tuple:
+                # Stagger start times so the first navigations aren't a burst
+                await asyncio.sleep(index * random.uniform(0.5, 1.0))
+                async with self.borrow_context(contexts) as context:
+                    return await self.collect_links(context, url)
+            
+            results = await asyncio.gather(
+                *(bounded_collect(i, url) for i, url in enumerate(AGGREGATOR_URLS)),
+                return_exceptions=True,
+            )
+            
+            # Merge on the event loop once every aggregator has finished
+            for url, result in zip(AGGREGATOR_URLS, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to scrape {url}: {result}")
                     continue
+                direct_domains, urls = result
+                all_found.update(direct_domains)
+                redirect_urls.update(urls)
+            
+            # Many aggregators share affiliate links, so resolve them once
+            all_found.update(await self.resolve_redirects(request_context, contexts, redirect_urls))
             
-            browser.close()
+            await request_context.dispose()
+            await browser.close()
         
         return all_found
     
@@ -291,33 +533,39 @@ class NonGamstopScraper:
         manual_file = Path(__file__).parent / 'domains' / 'manual.txt'
         domains = set()
         if manual_file.exists():
-            for line in manual_file.read_text().splitlines():
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    if self.is_valid_domain(line):
-                        domains.add(line.lower())
+            with manual_file.open(encoding='utf-8') as f:
+                # Keep entries as written (e.g. a deliberate www. host)
+                domains = {
+                    line for raw in f
+                    if (line := raw.strip().lower())
+                    and not line.startswith('#')
+                    and is_valid_domain(line)
+                }
             logger.info(f"Loaded {len(domains)} manual domains")
         return domains
     
     def generate_variants(self, domains: set) -> set:
-        variants = set()
-        for domain in domains:
-            parts = domain.split('.')
-            if len(parts) >= 2:
-                base = parts[0]
-                tld = '.'.join(parts[1:])
-                if not base[-1].isdigit():
-                    for i in range(1, 10):
-                        variants.add(f"{base}{i}.{tld}")
-        return {d for d in variants if self.is_valid_domain(d)}
+        # Domains are already validated, so appending a digit to the first
+        # label keeps them well-formed; only length (one character longer)
+        # and an exact exclusion match (e.g. w.org -> w3.org) can change.
+        return {
+            variant
+            for domain in domains if len(domain) < 100
+            for base, _, tld in (domain.partition('.'),)
+            if tld and base[-1] not in _DIGITS
+            for i in range(1, 10)
+            if (variant := f"{base}{i}.{tld}") not in EXCLUDE_DOMAINS
+        }
     
     def run(self) -> set:
         logger.info("Starting non-GamStop casino scraper...")
         
         self.domains.update(self.load_manual_domains())
         
-        scraped = self.scrape_with_browser()
+        self.load_redirect_cache()
+        scraped = asyncio.run(self.scrape_with_browser())
         self.domains.update(scraped)
+        self.save_redirect_cache()
         logger.info(f"Total unique domains: {len(self.domains)}")
         
         variants = self.generate_variants(self.domains)
@@ -329,7 +577,8 @@ class NonGamstopScraper:
 
 def generate_blocklist_files(domains: set, output_dir: Path):
     output_dir.mkdir(parents=True, exist_ok=True)
-    sorted_domains = sorted(domains)
+    sorted_domains = tuple(sorted(domains))
+    count = len(sorted_domains)
     timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
     
     header = f"""# Non-GamStop Gambling Blocklist
@@ -339,21 +588,28 @@ def generate_blocklist_files(domains: set, output_dir: Path):
 #
 # Repository: https://github.com/dancharlton9/gambling-blocklist
 # Last updated: {timestamp}
-# Total domains: {len(sorted_domains)}
+# Total domains: {count}
 
 """
 
-    (output_dir / 'blocklist.txt').write_text(header + '\n'.join(sorted_domains))
-    
-    hosts_lines = [f"0.0.0.0 {d}" for d in sorted_domains]
-    (output_dir / 'blocklist-hosts.txt').write_text(header + '\n'.join(hosts_lines))
-    
-    adguard_lines = [f"||{d}^" for d in sorted_domains]
-    (output_dir / 'blocklist-adguard.txt').write_text(header.replace('# ', '! ') + '\n'.join(adguard_lines))
+    # Write the plain, hosts and AdGuard lists in a single pass, encoding
+    # each domain once and sharing the bytes between all three files
+    with (output_dir / 'blocklist.txt').open('wb') as plain, \
+            (output_dir / 'blocklist-hosts.txt').open('wb') as hosts, \
+            (output_dir / 'blocklist-adguard.txt').open('wb') as adguard:
+        plain.write(header.encode())
+        hosts.write(header.encode())
+        adguard.write(header.replace('# ', '! ').encode())
+        sep = b''
+        for d in sorted_domains:
+            d = d.encode()
+            plain.write(sep + d)
+            hosts.write(sep + b'0.0.0.0 ' + d)
+            adguard.write(sep + b'||' + d + b'^')
+            sep = b'\n'
     
-    (output_dir / 'blocklist.json').write_text(
-        json.dumps({'updated': timestamp, 'count': len(sorted_domains), 'domains': sorted_domains}, indent=2)
-    )
+    with (output_dir / 'blocklist.json').open('w') as f:
+        json.dump({'updated': timestamp, 'count': count, 'domains': sorted_domains}, f, indent=2)
     
     logger.info(f"Generated blocklists in {output_dir}")
 